@@ -5,6 +5,7 @@ Not part of the core functionality, and largely vestigial at this point.
 """
 from legendlore.collection import Monsters, Spells
 from collections import defaultdict, Counter
+from heapq import nlargest
 from pprint import pprint, pformat
 from functools import partial
 import statistics
@@ -14,7 +15,9 @@ pprint = partial(pprint, indent=2, width=100)
 pformat = partial(pformat, indent=2, width=100)
 
 def indent(text, prefix='    '):
-    return '\n'.join(prefix + line for line in text.split("\n"))
+    # list comprehension rather than a generator: str.join materializes
+    # its argument anyway, and skipping the generator protocol is faster
+    return '\n'.join([prefix + line for line in text.split("\n")])
 
 def group(iterable, key):
     ret = defaultdict(list)
@@ -27,26 +30,32 @@ def sort_group(group):
 
 # TODO: update so it can take zero arguments
 def spell_tag_analysis(tree=XML.get_tree()):
-    spells = tree.xpath("//spell")
-    spell_nodes = tree.xpath("//spell/*")
+    # Spells are direct children of the root, so iterate them directly
+    # rather than paying for a full-document descendant scan with '//spell'.
+    spells = list(tree.getroot().iterchildren('spell'))
+    spell_nodes = [child for spell in spells for child in spell.iterchildren()]
     print(len(spells))
     print(len(spell_nodes))
     print(dir(spell_nodes[0]))
     print(spell_nodes[0].__class__)
     print(spell_nodes[0].tag)
 
-    spell_tags = set((node.tag for node in spell_nodes))
+    # group once and derive the tag set from the group keys rather than
+    # making a separate pass over the nodes
+    spell_tag_groups = group(spell_nodes, lambda n: n.tag)
+    spell_tags = set(spell_tag_groups)
     print(spell_tags)
 
-    spell_tag_groups = group(spell_nodes, lambda n: n.tag).items()
-    for k, g in spell_tag_groups:
+    for k, g in spell_tag_groups.items():
         print("{0}: {1} nodes".format(k, len(g)))
         value_group = group(g, lambda n: n.text)
-        if len(value_group.keys()) > 20:
-            print("  {0} unique values.  Top Ten:".format(len(value_group.keys())))
-            topten = sort_group(value_group)[:10]
+        if len(value_group) > 20:
+            print("  {0} unique values.  Top Ten:".format(len(value_group)))
+            # only the ten biggest groups are wanted, so a bounded heap
+            # selection beats sorting the whole group
+            topten = nlargest(10, value_group.items(), key=lambda i: len(i[1]))
             summary = lambda i: '    {0}: {1}'.format(len(i[1]), str(i[0]))
-            print('\n'.join(summary(item) for item in topten))
+            print('\n'.join([summary(item) for item in topten]))
         else:
             for h, i in sort_group(value_group):
                 print("  {0}: {1} nodes".format(h, len(i)))
@@ -57,15 +66,30 @@ def parsed_spells_analysis(spells):
     print('spell count: {0}'.format(len(spells)))
     print('first spell:')
     pprint(spells[0])
+    # accumulate all of the per-spell breakdowns in a single pass
+    class_counts = Counter()
+    no_classes = []
+    no_source = []
+    book_counts = Counter()
+    for spell in spells:
+        classes = spell['classes']
+        class_counts.update(classes)
+        if not classes:
+            no_classes.append(spell)
+        sources = spell.get('sources', False)
+        if not sources:
+            no_source.append(spell)
+        else:
+            book_counts.update(ref.book for ref in sources)
+
     print('class occurrence counts:')
-    pprint(Counter(c for spell in spells for c in spell['classes']),
-           compact=True, width=160)
+    pprint(class_counts, compact=True, width=160)
     print('spells with no classes:')
-    pprint([spell for spell in spells if not spell['classes']])
+    pprint(no_classes)
     print('spells with no source:')
-    pprint([spell for spell in spells if not spell.get('sources', False)])
+    pprint(no_source)
     print('spell books:')
-    pprint(Counter(ref.book for s in spells for ref in s['sources']))
+    pprint(book_counts)
 
 def analyze_monster_nodes(tree=XML.get_tree()):
     """Output a bunch of info about the monster nodes in the DB."""
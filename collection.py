@@ -5,6 +5,9 @@ Contains the Collection base class and classes for specific types of collections
 These are list-like objects with some added methods.
 """
 from functools import partial
+from operator import itemgetter, methodcaller
+from collections import defaultdict
+from lxml import etree
 from legendlore import parse, predicates, reflect, db_items
 from legendlore.util import careful_sum
 import pprint as pp_module
@@ -17,7 +20,8 @@ class Collection(list):
     This base class for Monsters and Spells is only useful when subclassed.
 
     Subclasses implement:
-    - _xpath: string, finds all objects of the collection type in the tree
+    - _xpath: compiled etree.XPath, finds all objects of the collection type in the tree
+    - _tag: string, element tag streamed by iter_raw
     - type: type the subtype collects
         - e.g. Monsters._type = Monster
     """
@@ -57,12 +61,58 @@ class Collection(list):
         if not tree:
             tree = parse.XML.get_tree()
 
-        objects = tree.xpath(self._xpath)
+        objects = self._xpath(tree)
         super().__init__(self._type(i) for i in objects)
         self._apply_errata()
         if store_tree:
             self.__class__._parsed = self
 
+    @classmethod
+    def by_name(cls, name):
+        """Look up a DB item by exact name without a linear scan.
+
+        Parses the DB on first use, then answers from the cached full
+        collection's name index, so repeated interactive lookups are
+        dict hits.  Returns the first match, or None as `get` does.
+        """
+        if not hasattr(cls, '_parsed'):
+            cls()
+        return cls._parsed.get(name)
+
+    @classmethod
+    def iter_raw(cls, db_file=parse.default_db_file):
+        """Yields this collection's item type straight from the DB file.
+
+        Streams elements with `parse.XML.stream_nodes` instead of building
+        (or waiting on) the full tree, so early-exiting consumers --
+        e.g. `next(m for m in Monsters.iter_raw() if m.name == name)` on a
+        cold start -- stop paying parse costs as soon as they stop
+        iterating, and peak memory stays constant.
+
+        Note that collection errata are not applied; use the regular
+        constructor when exact class lists and de-duplication matter.
+
+        Items stream in document order, so the first item matches the
+        parsed collection's (monsters have no de-duplication errata):
+
+        >>> next(Monsters.iter_raw()).name == Monsters()[0].name
+        True
+        """
+        for element in parse.XML.stream_nodes(cls._tag, db_file=db_file):
+            yield cls._type(element)
+
+    @classmethod
+    def _wrap(cls, items):
+        """Wraps `items` in a collection of this type without DB setup.
+
+        Internal fast path for methods that derive new collections from
+        an existing one: skips __init__'s parse/cache logic and fills
+        the list directly.
+        """
+        ret = list.__new__(cls)
+        list.__init__(ret, items)
+        return ret
+
     def __getitem__(self, key):
         """Return a collection of the same type if `key` is a slice.
 
@@ -77,7 +127,7 @@ class Collection(list):
         """
         ret = super().__getitem__(key)
         if type(key) is slice:
-            return type(self)(ret)
+            return self._wrap(ret)
         else:
             return ret
 
@@ -89,21 +139,130 @@ class Collection(list):
         """Case-insensitive contents search over the data set
 
         Returns items where `field` contains `val`.
+
+        The lowercased text of each searched field is cached on the
+        collection the first time that field is searched, so repeated
+        searches skip the per-item str/lower calls.  `extend` drops the
+        cache when it adds items.
+
         >>> Monsters().search('AAR')[0]
         Monster(Aarakocra: M NG humanoid (aarakocra), 1/4CR DPR=4.1/2.8/1.4 13HP/3d8 12AC (walk 20, fly 50))
         >>> Spells().search('smite')[0]
         Spell(Banishing Smite B/S/C<=1m [V] (5:ABS+P+WlH))
         """
-        def lc_in(term):
-            return str(val).lower() in str(getattr(term, field, '')).lower()
-        return self.__class__(i for i in self if lc_in(i))
+        needle = str(val).lower()
+        try:
+            cache = self._lc_cache
+        except AttributeError:
+            cache = self._lc_cache = {}
+        try:
+            haystacks = cache[field]
+        except KeyError:
+            haystacks = cache[field] = [str(getattr(i, field, '')).lower()
+                                        for i in self]
+        return self._wrap([i for i, h in zip(self, haystacks) if needle in h])
+
+    def starts_with(self, prefixes):
+        """Items whose name starts with `prefixes` (a string or tuple).
+
+        Passing a tuple checks all the prefixes in a single pass:
+
+        >>> Monsters().starts_with('Aarak')[0].name
+        'Aarakocra'
+        >>> Monsters().starts_with(('Zzzz', 'Aarak'))[0].name
+        'Aarakocra'
+        """
+        if isinstance(prefixes, str):
+            prefixes = (prefixes,)
+        return self._wrap([i for i in self if i.name.startswith(prefixes)])
+
+    def search_many(self, terms, field='name'):
+        """Batched form of `search`: look up several substrings in one pass.
+
+        Returns a dict mapping each term to the Collection of items whose
+        `field` contains it, case-insensitively.  The lowercased field
+        text is computed (or pulled from the search cache) once for the
+        whole batch instead of once per term.
+
+        Terms without matches map to an empty collection:
+
+        >>> hits = Spells().search_many(['smite', 'zzzz'])
+        >>> hits['smite'][0]
+        Spell(Banishing Smite B/S/C<=1m [V] (5:ABS+P+WlH))
+        >>> hits['zzzz']
+        []
+        """
+        needles = [(term, str(term).lower()) for term in terms]
+        try:
+            cache = self._lc_cache
+        except AttributeError:
+            cache = self._lc_cache = {}
+        try:
+            haystacks = cache[field]
+        except KeyError:
+            haystacks = cache[field] = [str(getattr(i, field, '')).lower()
+                                        for i in self]
+        hits = {term: [] for term, _ in needles}
+        for i, h in zip(self, haystacks):
+            for term, needle in needles:
+                if needle in h:
+                    hits[term].append(i)
+        return {term: self._wrap(found) for term, found in hits.items()}
+
+    def _by_name(self):
+        """Index of items keyed by exact name, built on first use.
+
+        Values are lists since some names (notably monsters) recur in
+        the DB.  `extend` drops the index when it adds items.
+        """
+        try:
+            return self._name_index
+        except AttributeError:
+            index = {}
+            for i in self:
+                index.setdefault(getattr(i, 'name', None), []).append(i)
+            self._name_index = index
+            return index
+
+    def get(self, name):
+        """Returns the first item whose name is exactly `name`, or None.
+
+        Unlike `search`, this is an exact, case-sensitive match, served
+        from an index rather than a scan.
+
+        >>> Monsters().get('Aarakocra')
+        Monster(Aarakocra: M NG humanoid (aarakocra), 1/4CR DPR=4.1/2.8/1.4 13HP/3d8 12AC (walk 20, fly 50))
+        >>> print(Monsters().get('No Such Monster'))
+        None
+        """
+        matches = self._by_name().get(name)
+        return matches[0] if matches else None
 
     def filter(self, pred):
         """Returns Collection of the appropriate subclass.
 
         Collection (e.g. Monsters object) contains items for which pred(item) is True.
         """
-        return self.__class__(i for i in self if pred(i))
+        return self._wrap([i for i in self if pred(i)])
+
+    def first(self, predicate):
+        """Return the first item satisfying `predicate`.
+
+        Single pass with early exit, so existence-style checks don't
+        build a whole filtered collection.  Raises LookupError if
+        nothing matches.
+
+        >>> Monsters().first(lambda m: m.name == 'Aarakocra')
+        Monster(Aarakocra: M NG humanoid (aarakocra), 1/4CR DPR=4.1/2.8/1.4 13HP/3d8 12AC (walk 20, fly 50))
+        >>> Monsters().first(lambda m: m.name == 'No Such Monster')
+        Traceback (most recent call last):
+            ...
+        LookupError: Collection.first: no item matched
+        """
+        for item in self:
+            if predicate(item):
+                return item
+        raise LookupError('Collection.first: no item matched')
 
     def text_match(self, text):
         """Case-insensitive search over all text fields.
@@ -115,7 +274,7 @@ class Collection(list):
          Monster(Asharra: M LN humanoid (aarakocra), 2.0CR DPR=4.1/2.8/1.4 31HP/7d8 12AC (walk 20, fly 50)),
          Monster(Mwaxanaré: M LN humanoid (human), 1/8CR DPR=1.6/1.0/0.4 13HP/3d8 10AC (walk 30))]
         """
-        return self.__class__(i for i in self if i.text_match(text))
+        return self._wrap([i for i in self if i.text_match(text)])
 
     def where(self, **kwargs):
         """Filter for items for which all conditions are true.
@@ -140,14 +299,35 @@ class Collection(list):
         >>> Monsters().where(spells=p.contains('conjure animals'))[0].name
         'Horncaller'
         """
-        result = self
+        # the common exact-name query answers from the lazy name index
+        # instead of scanning
+        if len(kwargs) == 1 and type(kwargs.get('name')) is str:
+            matches = self._by_name().get(kwargs['name'])
+            return self._post_process_where(self._wrap(matches or []))
+
+        # plain values get an inlined equality check instead of a
+        # predicates.eq closure; the `!= None` guard mirrors eq, letting
+        # datatypes with custom __eq__ decide whether they count as empty
+        scalars = []
+        preds = []
         for field, value in kwargs.items():
             if hasattr(value, '__call__'):
-                pred = value
+                preds.append((field, value))
             else:
-                pred = predicates.eq(value)
+                scalars.append((field, value))
+
+        # run cheaper, more selective predicates first (see
+        # predicates._ranked); the sort is stable, so equal ranks keep
+        # their keyword order
+        preds.sort(key=lambda fp: getattr(fp[1], '_rank', 3))
 
-            result = result.filter(partial(pred, field))
+        # test every condition in one pass rather than building an
+        # intermediate collection per keyword
+        result = self._wrap(
+            [i for i in self
+             if all((a := getattr(i, field, None)) != None and a == value
+                    for field, value in scalars)
+             and all(pred(field, i) for field, pred in preds)])
 
         return self._post_process_where(result)
 
@@ -243,12 +423,15 @@ class Collection(list):
         if key == None:
             key = lambda o: getattr(o, field, None)
 
-        # pull out nodes that lack the field
-        without_field = [n for n in self if key(n) is None]
-        with_field = [n for n in self if key(n) is not None]
+        # compute each key exactly once, then partition on the cached values
+        keyed = [(key(n), n) for n in self]
+        without_field = [n for k, n in keyed if k is None]
+        with_field = [pair for pair in keyed if pair[0] is not None]
 
-        # sort the nodes that have the field
-        with_field.sort(key=key, reverse=reverse)
+        # sort the nodes that have the field; itemgetter keeps ties from
+        # falling through to comparisons between the nodes themselves
+        with_field.sort(key=itemgetter(0), reverse=reverse)
+        with_field = [n for k, n in with_field]
 
         # return None values at the low end of the list
         if not reverse:
@@ -256,7 +439,7 @@ class Collection(list):
         else:
             ret = with_field + without_field
 
-        return type(self)(ret)
+        return self._wrap(ret)
 
     def extend(self, new_items):
         """Adds to `self` any items from `new_items` not already in `self`.
@@ -291,9 +474,17 @@ class Collection(list):
         Crown of Stars A/S/1h [V/S] (7:S+Wl+Wz)
         Plane Shift A/T/I [V/S/M@250gp] (7:C+D+S+Wl+Wz)
         """
+        # DB items compare by identity (no __eq__), so an id() set gives
+        # the same membership answer as `i not in self` without the
+        # linear scan per new item
+        seen = set(map(id, self))
         for i in new_items:
-            if i not in self:
+            if id(i) not in seen:
                 self.append(i)
+                seen.add(id(i))
+        # cached search text and name index no longer cover the collection
+        self.__dict__.pop('_lc_cache', None)
+        self.__dict__.pop('_name_index', None)
         return self
 
     # TODO: move this into Collection and add Monsters doctests
@@ -324,7 +515,10 @@ class Collection(list):
           " You can't have more than one mount bonded by this spell or find steed at the same time. As an action, you can release a mount from its bond, causing it to disappear permanently.
           " Whenever the mount disappears, it leaves behind any objects it was wearing or carrying.
         """
-        return '\n'.join(getattr(i, 'fmt_' + method)(**kwargs) for i in self)
+        # resolve the method name once; methodcaller does the per-item
+        # lookup in C instead of getattr plus string concat per item
+        call = methodcaller('fmt_' + method, **kwargs)
+        return '\n'.join([call(i) for i in self])
 
     def print(self, *args, **kwargs):
         """CLI convenience function.
@@ -381,7 +575,8 @@ class Spells(Collection):
     If not, uses the full set of spells from the DB instead.
     """
 
-    _xpath = '//spell'
+    _xpath = etree.XPath('//spell')
+    _tag = 'spell'
     _type = db_items.Spell
 
     def _apply_errata(self):
@@ -412,18 +607,23 @@ class Spells(Collection):
         for spell in self:
             spell.classes = sorted(list(set(spell.classes)))
 
-        # find the duplicates
-        dupspells = []
-        for i in range(0, len(self)):
-            if self[i].name in [j.name for j in self[i+1:]]:
-                dupspells += [self[i].name]
-
-        for spellname in dupspells:
-            dupes = self.where(name=spellname)
-            # sort by # of sources, leave the highest
-            dupes_to_delete = sorted(dupes, key=lambda spell: len(spell.sources))[:-1]
-            for dupe in dupes_to_delete:
-                self.remove(dupe)
+        # group spells by name in one pass instead of rescanning the
+        # tail of the list for every entry
+        by_name = defaultdict(list)
+        for spell in self:
+            by_name[spell.name].append(spell)
+
+        # of each set of duplicates, keep the entry with the most
+        # sources; ties keep the later entry, matching the stable sort
+        # this replaces
+        doomed = set()
+        for spells in by_name.values():
+            if len(spells) > 1:
+                keep = max(enumerate(spells),
+                           key=lambda pair: (len(pair[1].sources), pair[0]))[1]
+                doomed.update(id(spell) for spell in spells if spell is not keep)
+        if doomed:
+            self[:] = [spell for spell in self if id(spell) not in doomed]
 
     def search_desc(self, val):
         return self.search(val, field='text')
@@ -435,16 +635,19 @@ class Spells(Collection):
     # kind of an example function.
     def oneline_desc(self, string):
         """Returns one-line summaries of all spells with `string` in their descriptions."""
-        return '\n'.join(Spell.fmt_oneline(s) for s in self.search_desc(string))
+        # bind the formatter once; a local lookup per row beats a
+        # per-instance attribute lookup
+        fmt = db_items.Spell.fmt_oneline
+        return '\n'.join([fmt(s) for s in self.search_desc(string)])
 
     def csv_table(self):
         """Returns CSV tabular data with a header for the contents of this list."""
         fields = ['name', 't', 'r', 'd', 'l']
-        fields += [Spell.abbrev_class(c) for c in Spell.char_classes]
+        fields += db_items.Spell.char_class_abbrevs
         lines = [', '.join(fields)]
 
-        lines += [Spell.summary_class_columns(s, Spell.char_classes)
-                  for s in self]
+        summarize = db_items.Spell.summary_class_columns
+        lines += [summarize(s) for s in self]
 
         return "\n".join(lines)
 
@@ -455,7 +658,7 @@ class Spells(Collection):
 class Monsters(Collection):
     """List of all the <monster> entries in the db.
 
-    >>> monster = lambda name: next(m for m in Monsters() if m.name == name)
+    >>> monster = Monsters.by_name
     >>> monster('Champion').ac_num
     18
     >>> monster('Champion').armor
@@ -479,7 +682,8 @@ class Monsters(Collection):
     >>> Monsters(m for m in Monsters() if getattr(m, 'name').startswith('C'))[0]
     Monster(Cambion: M Any Evil Alignment fiend, 5.0CR DPR>=~9.4/6.8/4.2 82HP/11d8+33 19AC (walk 30, fly 60))
     """
-    _xpath = '//monster'
+    _xpath = etree.XPath('//monster')
+    _tag = 'monster'
     _type = db_items.Monster
 
     def _post_process_where(self, result):
@@ -5,6 +5,8 @@ Data types for aspects of entities found in db_items.py.
 from functools import total_ordering
 from logging import warning
 from collections import namedtuple
+from sys import intern
+from types import MappingProxyType
 
 @total_ordering
 class OrderedField:
@@ -12,6 +14,20 @@ class OrderedField:
 
     Also provides abbreviation functionality.
     """
+    # Instances only ever hold the wrapped value, and three of them are
+    # created per spell, so a slot is cheaper than a per-instance dict.
+    __slots__ = ('value',)
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the ordinal position of each value in the subclass.
+
+        Comparisons look positions up in this table instead of scanning
+        _values each time.
+        """
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, '_values'):
+            cls._ordinals = {value: i for i, value in enumerate(cls._values)}
+
     def __init__(self, value):
         """Attempt to remap the value if it's not in our known value set.
 
@@ -93,13 +109,14 @@ class OrderedField:
         >>> SpellRange('90 feet')._ord()
         26
         """
-        for i, r in enumerate(self._values.keys()):
-            if r == self.value:
-                return i
-        raise ValueError(f'SpellRange._ord: self.value "{self.value}" not found in self._values')
+        try:
+            return self._ordinals[self.value]
+        except KeyError:
+            raise ValueError(f'SpellRange._ord: self.value "{self.value}" not found in self._values')
 
 class SpellRange(OrderedField):
     """Ordered set of all ranges and their abbreviated form."""
+    __slots__ = ()
     _values = {
         None: "N",
         'Self': 'S',
@@ -145,6 +162,7 @@ class SpellRange(OrderedField):
         }
 
 class CastingTime(OrderedField):
+    __slots__ = ()
     _values = {
         '1 reaction': 'R',
         '1 reaction, which you take when you take acid, cold, fire, lightning, or thunder damage': 'R*',
@@ -170,6 +188,7 @@ class SpellDuration(OrderedField):
     Abbreviations include:
     S (special), 1r (1 round), 1m, 1h, <=1h
     """
+    __slots__ = ()
     _values = {
         'Instantaneous': 'I',
         'Instantaneous or 1 hour (see below)': 'I/1h',
@@ -300,6 +319,12 @@ caster_classes = {
     'Wizard (Graviturgy)': "WzG",
     'Wizard (Illusion)': "WzI",
     }
+# Intern both names and abbreviations: the parser interns the class names
+# it reads from spell nodes, so interning here makes those lookups hit the
+# same shared string objects.  The MappingProxyType view keeps the shared
+# table read-only without copying it.
+caster_classes = MappingProxyType({intern(k): intern(v)
+                                   for k, v in caster_classes.items()})
 
 
 # damage types as they are used in the XML file
@@ -620,15 +645,21 @@ class ReversibleDict(dict):
     def reverse_lookup(self, v):
         """Returns the key whose value equals `v`.
 
+        The reversed mapping is built on first use and reused afterwards,
+        so lookups don't rescan the dictionary.  As the mapping is
+        one-to-one, the reversal is lossless.
+
         >>> rd = ReversibleDict({1: 'one', 2: 'two'})
         >>> rd.reverse_lookup('one')
         1
         >>> rd.reverse_lookup('two')
         2
         """
-        for key, value in self.items():
-            if value == v:
-                return key
+        try:
+            reverse = self._reverse
+        except AttributeError:
+            reverse = self._reverse = {value: key for key, value in self.items()}
+        return reverse.get(v)
 
 schools = ReversibleDict({
     "Evocation": 'EV',
@@ -658,6 +689,7 @@ sources = {
     "Icewind Dale: Rime of the Frostmaiden": 'RotF',
     "Tasha's Cauldron of Everything": 'TCoE',
     }
+sources = MappingProxyType(sources)
 
 # `Reference` tuple used by Spell class
 Reference = namedtuple('Reference', ('book', 'page'))
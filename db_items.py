@@ -75,8 +75,24 @@ class DBItem:
         """Abbreviate the list of sources for this DB item."""
         return ', '.join(ref.abbr() for ref in self.sources)
 
+    @property
+    def text_lines(self):
+        """`self.text` split into lines, cached after the first access.
+
+        Item text never changes after parsing, so repeated formatting
+        calls can reuse the same split.
+        """
+        try:
+            return self._text_lines
+        except AttributeError:
+            self._text_lines = self.text.split('\n')
+            return self._text_lines
+
     def _filter_fields(self, predicate):
-        return traverse_filter(self.__dict__, predicate)
+        # underscore-prefixed attributes are caches rather than item data,
+        # so they are excluded from field traversal
+        fields = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        return traverse_filter(fields, predicate)
 
     def text_match(self, text):
         """Returns true if any of the item's text fields match `text`.
@@ -106,6 +122,9 @@ class Spell(DBItem):
     char_classes = ["Artificer", "Bard", "Cleric", "Druid", "Fighter", "Monk",
                     "Paladin", "Ranger", "Rogue", "Sorcerer", "Warlock", "Wizard",
                     "Eldritch Invocations", "Martial Adept", "Ritual Caster"]
+    # abbreviations for char_classes; the list is static, so they are
+    # looked up once here rather than per table rendered
+    char_class_abbrevs = tuple(datatypes.caster_classes[c] for c in char_classes)
 
     def __init__(self, node):
         self.__dict__.update(parse.SpellParser.parse(node))
@@ -176,8 +195,18 @@ class Spell(DBItem):
         """Abbreviate the classes which have access to a given spell.
 
         Return values are those from abbrev_class, joined with '+'.
+
+        Cached per spell after the first call; class lists are stable
+        once collection errata have been applied.
         """
-        return '+'.join(Spell.abbrev_class(c) for c in spell.classes)
+        try:
+            return spell._abbrev_classes
+        except AttributeError:
+            # map straight through the lookup table; abbrev_class is just
+            # a keyed access plus a method call per class name
+            spell._abbrev_classes = '+'.join(
+                map(datatypes.caster_classes.__getitem__, spell.classes))
+            return spell._abbrev_classes
 
 
     def fmt_oneline(self):
@@ -209,9 +238,19 @@ class Spell(DBItem):
         Some spells have both consumed and non-consumed components with monetary value
         >>> test('Clone')
         'Clone 1h/T/I [V/S/M@2000+!1000!gp] (8:Wz)'
+
+        The summary is built once per spell and cached; spell fields are
+        stable once collection errata have been applied.
         """
-        f = self._abbrev_fields()
-        return "{name}{rit} {t}/{r}/{d} {c} ({l}:{classes})".format(**f)
+        try:
+            return self._fmt_oneline
+        except AttributeError:
+            rit = ' (rit.)' if self.ritual else ''
+            self._fmt_oneline = (
+                f'{self.name}{rit} {self.abbrev_time()}/{self.abbrev_range()}'
+                f'/{self.abbrev_duration()} {self.abbrev_components()}'
+                f' ({self.level}:{self.abbrev_classes()})')
+            return self._fmt_oneline
 
     def _abbrev_fields(self):
         """Returns dict with field names and abbreviations of their values.
@@ -278,13 +317,16 @@ class Spell(DBItem):
           " You create a wall of water on the ground at a point you can see within range. You can make the wall up to 30 feet long, 10 feet high, and 1 foot thick, or you can make a ringed wall up to 20 feet in diameter, 20 feet high, and 1 foot thick. The wall vanishes when the spell ends. The wall's space is difficult terrain.
           " Any ranged weapon attack that enters the wall's space has disadvantage on the attack roll, and fire damage is halved if the fire effect passes through the wall to reach its target. Spells that deal cold damage that pass through the wall cause the area of the wall they pass through to freeze solid (at least a 5-foot-square section is frozen). Each 5-foot-square frozen section has AC 5 and 15 hit points. Reducing a frozen section to 0 hit points destroys it. When a section is destroyed, the wall's water doesn't fill it.
         """
+        prefix = f'{" " * tabstop}{body} '
         ret = [f'{header} {spell.fmt_oneline()}']
-        linetwo = f'{" " * tabstop}{body} {spell.school} ({spell.abbrev_sources()})'
+        linetwo = f'{prefix}{spell.school} ({spell.abbrev_sources()})'
         material = spell.components.get('M', '')
         if material:
             linetwo += f'; Material components: {material}'
         ret += [linetwo]
-        ret += [f'{" " * tabstop}{body} {line}' for line in spell.text.split('\n')]
+        # prefix every text line with one replace instead of splitting
+        # and re-joining the whole body
+        ret += [prefix + spell.text.replace('\n', '\n' + prefix)]
         return '\n'.join(ret)
 
     def fmt_plop(self):
@@ -292,7 +334,7 @@ class Spell(DBItem):
         f = self._abbrev_fields()
         ret = ["{t}: {name}{rit} {t}/{r}/{d} (L{l})".format(**f)]
         ret += ["{name}: range: {r}, duration: {d}; level {l}".format(**f)]
-        ret += self.text.split("\n")
+        ret += self.text_lines
         ret = "\n".join(line for line in ret if line.strip() != '')
         return ret
 
@@ -302,21 +344,35 @@ class Spell(DBItem):
         Returns '*' if all do
         Returns '-' if none do
         Returns eg 'CO+CLf' if Order and Life clerics get the spell.
+
+        Results are cached per spell and class; csv_table asks the same
+        question for every class column of every row.
         """
+        try:
+            cache = spell._subclass_cache
+        except AttributeError:
+            cache = spell._subclass_cache = {}
+        try:
+            return cache[class_]
+        except KeyError:
+            pass
+
         if class_ in spell.classes:
-            return '*'
+            ret = '*'
         else:
             subclasses = [c for c in spell.classes
                           if c.startswith(class_)]
             if subclasses:
-                return '+'.join(Spell.abbrev_class(c) for c in subclasses)
+                ret = '+'.join(Spell.abbrev_class(c) for c in subclasses)
             else:
-                return '-'
+                ret = '-'
+        cache[class_] = ret
+        return ret
 
-    def summary_class_columns(spell, classes=char_classes):
-        """ Return a line summarizing the spell with a column for each class.
+    def summary_class_tuple(spell, classes=char_classes):
+        """Return the raw column values for one Spells.csv_table() row.
 
-        Uses CSV format and column set compatible with Spells.csv_table().
+        Column set matches summary_class_columns, which joins these.
         """
         components = [spell.name,
                       spell.abbrev_time(),
@@ -325,7 +381,91 @@ class Spell(DBItem):
                       str(spell.level) ]
         components += [spell.subclass_set(c) for c in classes]
 
-        return ', '.join(components)
+        return components
+
+    def summary_class_columns(spell, classes=char_classes):
+        """ Return a line summarizing the spell with a column for each class.
+
+        Uses CSV format and column set compatible with Spells.csv_table().
+        """
+        return ', '.join(spell.summary_class_tuple(classes))
+
+# constant tables for Monster.fmt_oneline, hoisted so a cache miss
+# doesn't rebuild them
+_align_abbrevs = {'Lawful Good'    : 'LG'  , 'Neutral Good' : 'NG' , 'Chaotic Good'    : 'CG' ,
+                  'Lawful Neutral' : 'LN'  , 'Neutral'      : 'TN' , 'Chaotic Neutral' : 'CN' ,
+                  'Lawful Evil'    : 'LE'  , 'Neutral Evil' : 'NE' , 'Chaotic Evil'    : 'CE' ,
+                  'Unaligned'      : 'UA'}
+
+# every CR string the DB can produce, precomputed so fmt_oneline does a
+# single dict lookup instead of branching on None / fractional / whole
+_cr_str = {None: '--', 0.125: '1/8', 0.25: '1/4', 0.5: '1/2',
+           **{float(n): str(float(n)) for n in range(31)}}
+
+def _render_monster_text(name=None, alignment=None, type=None,
+                         size=None, cr=None, hp=None, hitdice=None,
+                         ac=None, ac_num=None, speed=None,
+                         str=None, dex=None, con=None,
+                         int=None, wis=None, cha=None,
+                         skills=None, saves=None,
+                         passive=None, senses=None, senses_notes=None,
+                         spells=None, slots=None, armor=None,
+                         immune=None, immune_notes=None,
+                         resist=None, resist_notes=None,
+                         conditionImmune=None, conditionImmune_notes=None,
+                         vulnerable=None, description=None, actions=None):
+    """Renders the full-text monster layout for Monster.fmt_full."""
+    text = []
+
+    text.append(f'{name} ({alignment} {type})  Size: {size}  CR: {cr}')
+
+    text.append(f'HP: {hp}({hitdice})  AC: {ac}({ac_num})  Speed: {speed}')
+
+    text.append(f'STR:{str} DEX:{dex} CON:{con} INT:{int} WIS:{wis} CHA:{cha}')
+
+    if skills:
+        text.append(f'skills: {skills}')
+    if saves:
+        text.append(f'saves: {saves}')
+    text.append(f'passive perception: {passive}')
+    if senses:
+        text.append(f'senses: {senses}')
+        if senses_notes:
+            text.append(f'NOTE: {senses_notes}')
+
+    if spells:
+        text.append(f'spells: {spells}')
+    if slots:
+        text.append(f'slots: {slots}')
+
+    if armor:
+        text.append(f'armor: {armor}')
+
+    if immune:
+        text.append(f'immunities: {immune}')
+        if immune_notes:
+            text.append(f'NOTE: {immune_notes}')
+    if resist:
+        text.append(f'resistances: {resist}')
+        if resist_notes:
+            text.append(f'NOTE: {resist_notes}')
+    if conditionImmune:
+        text.append(f'condition immunities: {conditionImmune}')
+        if conditionImmune_notes:
+            text.append(f'NOTE: {conditionImmune_notes}')
+    if vulnerable:
+        text.append(f'vulnerabilities: {vulnerable}')
+
+    # * 'description': 255,
+    if description:
+        text.append(description)
+
+    if actions:
+        text.append('ACTIONS:')
+        for name, details in actions.items():
+            text.append(f'{name}: {details.get("text", "")}')
+
+    return '\n'.join(text)
 
 class Monster(DBItem):
     def __init__(self, node=None, **kwargs):
@@ -358,26 +498,27 @@ class Monster(DBItem):
         'Giant Crab: M UA beast, 1/8CR DPR=3.1/2.0/0.9 13HP/3d8 15AC (walk 30, swim 30)'
         >>> Monsters().where(name='Crab Folk')[0].fmt_oneline()
         'Crab Folk: L TN giant, 3.0CR DPR=12.8/9.0/5.2 68HP/8d10+24 16AC (walk 40, swim 40)'
+
+        The summary (including the DPR spread, the expensive part) is
+        cached per instance; callers that edit a monster's actions after
+        formatting it should expect a stale summary.
         """
-        fmt = '{name}: {size} {alignment} {type}, {cr}CR {dpr} {hp}HP/{hitdice} {ac_num}AC ({speeds})'
+        try:
+            return self._fmt_oneline
+        except AttributeError:
+            pass
 
-        fields = ['name', 'size', 'alignment', 'type', 'hp', 'hitdice', 'ac_num', 'dpr']
-        # fill `fields` from attributes of `self`
-        fields = {field: getattr(self, field, '--') for field in fields}
+        # these are all plain instance attributes, so read the instance
+        # dict directly; missing ones render as '--'
+        get = self.__dict__.get
 
-        align_abbrevs = {'Lawful Good'    : 'LG'  , 'Neutral Good' : 'NG' , 'Chaotic Good'    : 'CG' ,
-                         'Lawful Neutral' : 'LN'  , 'Neutral'      : 'TN' , 'Chaotic Neutral' : 'CN' ,
-                         'Lawful Evil'    : 'LE'  , 'Neutral Evil' : 'NE' , 'Chaotic Evil'    : 'CE' ,
-                         'Unaligned'      : 'UA'}
-        fields = {key: align_abbrevs[value] if key == 'alignment' and value in align_abbrevs else value
-                  for key, value in fields.items()}
+        alignment = get('alignment', '--')
+        alignment = _align_abbrevs.get(alignment, alignment)
 
-        cr_table = {0.125: '1/8', 0.25: '1/4', 0.5: '1/2'}
-        cr = getattr(self, 'cr', None)
-        fields['cr'] = '--' if cr is None else cr_table[cr] if cr % 1 else str(cr)
+        cr = _cr_str.get(get('cr')) or str(get('cr'))
 
-        speed = getattr(self, 'speed', {'NO': 'MOVEMENT'})
-        fields['speeds'] = ', '.join(' '.join([mode, str(dist)]) for mode, dist in speed.items())
+        speed = get('speed', {'NO': 'MOVEMENT'})
+        speeds = ', '.join(' '.join([mode, str(dist)]) for mode, dist in speed.items())
 
         if hasattr(self, 'actions') and self.actions.attacks:
             process_dpr = lambda dpr: '??' if dpr is None else str(round(dpr, 1))
@@ -387,76 +528,15 @@ class Monster(DBItem):
         else:
             dpr_text = 'DPR:??'
             # many creatures have attack actions which do not include the attack bonus and damage elements.
-        fields['dpr'] = dpr_text
 
-        # inject the fields from `self` into the format string
-        return fmt.format(**fields)
+        # an f-string skips str.format's spec parsing and kwargs dict
+        self._fmt_oneline = (
+            f"{get('name', '--')}: {get('size', '--')} {alignment} "
+            f"{get('type', '--')}, {cr}CR {dpr_text} {get('hp', '--')}HP/"
+            f"{get('hitdice', '--')} {get('ac_num', '--')}AC ({speeds})")
+        return self._fmt_oneline
 
     def fmt_full(self):
-        def render_text(name=None, alignment=None, type=None,
-                        size=None, cr=None, hp=None, hitdice=None,
-                        ac=None, ac_num=None, speed=None,
-                        str=None, dex=None, con=None,
-                        int=None, wis=None, cha=None,
-                        skills=None, saves=None,
-                        passive=None, senses=None, senses_notes=None,
-                        spells=None, slots=None, armor=None,
-                        immune=None, immune_notes=None,
-                        resist=None, resist_notes=None,
-                        conditionImmune=None, conditionImmune_notes=None,
-                        vulnerable=None, description=None, actions=None):
-            text = []
-
-            text.append(f'{name} ({alignment} {type})  Size: {size}  CR: {cr}')
-
-            text.append(f'HP: {hp}({hitdice})  AC: {ac}({ac_num})  Speed: {speed}')
-
-            text.append(f'STR:{str} DEX:{dex} CON:{con} INT:{int} WIS:{wis} CHA:{cha}')
-
-            if skills:
-                text.append(f'skills: {skills}')
-            if saves:
-                text.append(f'saves: {saves}')
-            text.append(f'passive perception: {passive}')
-            if senses:
-                text.append(f'senses: {senses}')
-                if senses_notes:
-                    text.append(f'NOTE: {senses_notes}')
-
-            if spells:
-                text.append(f'spells: {spells}')
-            if slots:
-                text.append(f'slots: {slots}')
-
-            if armor:
-                text.append(f'armor: {armor}')
-
-            if immune:
-                text.append(f'immunities: {immune}')
-                if immune_notes:
-                    text.append(f'NOTE: {immune_notes}')
-            if resist:
-                text.append(f'resistances: {resist}')
-                if resist_notes:
-                    text.append(f'NOTE: {resist_notes}')
-            if conditionImmune:
-                text.append(f'condition immunities: {conditionImmune}')
-                if conditionImmune_notes:
-                    text.append(f'NOTE: {conditionImmune_notes}')
-            if vulnerable:
-                text.append(f'vulnerabilities: {vulnerable}')
-
-            # * 'description': 255,
-            if description:
-                text.append(description)
-
-            if actions:
-                text.append('ACTIONS:')
-                for name, details in actions.items():
-                    text.append(f'{name}: {details.get("text", "")}')
-
-            return '\n'.join(text)
-
         fields = ['name', 'alignment', 'type', 'size', 'cr',
                   'hp', 'hitdice', 'ac', 'ac_num', 'speed',
                   'str', 'dex', 'con', 'int', 'wis', 'cha',
@@ -466,8 +546,8 @@ class Monster(DBItem):
                   'conditionImmune', 'conditionImmune_notes',
                   'vulnerable', 'description', 'actions']
 
-        fields = dict((f, getattr(self, f, None)) for f in dir(self) if f in fields)
-        return render_text(**fields)
+        fields = {f: getattr(self, f, None) for f in fields}
+        return _render_monster_text(**fields)
 
     def fmt_pointform(self, header='-', body='-', tabstop=2):
         """Multiline string containing point-form summary of item.
@@ -488,8 +568,12 @@ class Monster(DBItem):
           - armor: leather armor, shield
         ...
         """
+        prefix = f'{" " * tabstop}{body} '
         ret = [f'{header} {self.fmt_oneline()}']
-        ret += [f'{" " * tabstop}{body} {line}' for line in self.fmt_full().split('\n')[2:]]
+        # drop the first two lines, then prefix the rest with one replace
+        tail = self.fmt_full().split('\n', 2)[2:]
+        if tail:
+            ret += [prefix + tail[0].replace('\n', '\n' + prefix)]
         return '\n'.join(ret)
 
     @property
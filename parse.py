@@ -8,11 +8,18 @@ for each type of database item (spells, monsters, etc.).
 
 The subclasses consist of generator methods `yield_*` which are called
 when the base class encounters an element with a matching tag.
+
+Performance note: the hot paths in this package are XML parsing and
+string joining, both of which already run in C (lxml and str.join).
+JIT compilers like Numba can't accelerate this kind of object/string
+code and their warmup would dwarf the work; keep optimizations at the
+level of lxml usage, caching, and fewer Python-level operations per
+element.
 """
 import re
 from lxml import etree
 from logging import debug, warning, error
-from functools import reduce, partial
+from functools import reduce, partial, lru_cache
 from pprint import pprint, pformat
 from textwrap import dedent
 from fractions import Fraction
@@ -23,6 +30,7 @@ from itertools import groupby, chain
 chainfi = chain.from_iterable
 from collections import defaultdict
 from os import path
+from sys import intern
 
 
 default_db_file = path.join(path.dirname(__file__), 'FightClub5eXML', 'FightClub5eXML', 'Collections', 'CoreOnly.xml')
@@ -66,11 +74,18 @@ class XML:
 
     @classmethod
     def parse_db(cls, db_file=default_db_file):
-        """Parse XML file with lxml parser."""
+        """Parse XML file with lxml parser.
+
+        The parser skips xml:id hash table collection (nothing looks
+        elements up by ID) and lifts libxml2's safety limits for large
+        inputs.  Note that blank text nodes are significant -- spell and
+        monster text preserves blank lines -- so they are not stripped.
+        """
         debug('Parsing xml...')
-        parser = etree.XMLParser()
-        with open(db_file, 'r') as xmlfile:
-            tree = etree.parse(xmlfile, parser)
+        parser = etree.XMLParser(collect_ids=False, huge_tree=True)
+        # lxml handles the file I/O and encoding itself when given the
+        # filename, avoiding a Python-level decode of the whole document
+        tree = etree.parse(db_file, parser)
         debug('...done')
         cls.apply_errata(tree)
         return tree
@@ -85,6 +100,24 @@ class XML:
             cls.tree = cls.parse_db(db_file)
         return cls.tree
 
+    @classmethod
+    def stream_nodes(cls, tag, db_file=default_db_file):
+        """Iterates top-level elements with tag `tag` without building the full tree.
+
+        Each element is yielded as its closing tag is parsed, then cleared
+        along with any previously-parsed siblings, so peak memory stays
+        constant regardless of database size.
+
+        This is a low-memory alternative to `get_tree` for single-pass
+        consumers; the yielded elements must be fully processed before the
+        next iteration since their contents are discarded afterwards.
+        """
+        for _, element in etree.iterparse(db_file, events=('end',), tag=tag):
+            yield element
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
 #### Generic parsing functions
 def yield_text(element, node):
     """The most basic element parser.
@@ -92,16 +125,28 @@ def yield_text(element, node):
     Just returns (tag, text).
     """
     if element.text is None:
-        debug(f'yield_text: None value for text in element with tag "{element.tag}"')
+        debug('yield_text: None value for text in element with tag "%s"', element.tag)
         # This can happen when there's a tag like `<spells/>` in the XML
         return
     else:
         yield (element.tag, element.text)
 
+def yield_interned_text(element, node):
+    """Like yield_text but interns the value.
+
+    For low-cardinality category fields (size, type, alignment) this
+    collapses the many duplicate strings in the DB down to one shared
+    object per distinct value.
+    """
+    if element.text is None:
+        debug('yield_interned_text: None value for text in element with tag "%s"', element.tag)
+    else:
+        yield (element.tag, intern(element.text))
+
 def yield_int(element, node):
     """Yield an integer that comprises the entirety of `element.text`."""
     if element.text is None:
-        debug(f'yield_int: None value for text in element with tag "{element.tag}"')
+        debug('yield_int: None value for text in element with tag "%s"', element.tag)
     else:
         yield (element.tag, int(element.text))
 
@@ -130,13 +175,13 @@ def yield_fraction(element, node):
     text = element.text
 
     if text == None:
-        debug(f'yield_fraction: None value for text in element with tag "{field}"')
+        debug('yield_fraction: None value for text in element with tag "%s"', field)
         return
 
     try:
         yield (field, float(Fraction(text)))
     except ValueError:
-        warning(f'yield_fraction: failed to parse text "{text}"')
+        warning('yield_fraction: failed to parse text "%s"', text)
 
 def yield_datatype(datatype, element, node):
     """Instantiates an object of type `datatype` and yields it."""
@@ -209,7 +254,7 @@ class NodeParser():
             try:
                 parsefn = getattr(cls, 'yield_' + element.tag)
             except AttributeError:
-                warning(f'NodeParser._parse: unknown tag "{element.tag}"')
+                warning('NodeParser._parse: unknown tag "%s"', element.tag)
                 continue
             yield from parsefn(element, node)
 
@@ -258,12 +303,16 @@ class NodeParser():
 #### Derived parser classes
 class MonsterParser(NodeParser):
     """Parser for <monster> nodes."""
-    yield_size = yield_text
-    yield_type = yield_text
-    yield_alignment = yield_text
+    yield_size = yield_interned_text
+    yield_type = yield_interned_text
+    yield_alignment = yield_interned_text
 
-    @staticmethod
-    def yield_ac(element, node):
+    # number optionally followed by a parenthesized note, e.g. "10 (natural armor)";
+    # compiled once since it runs against every monster's ac and hp fields
+    re_num_note = re.compile('^(\d+)(?: \(([^)]*)\))?$')
+
+    @classmethod
+    def yield_ac(cls, element, node):
         """Yield ac attributes.
 
         If a numeric AC is parsed, it is yielded as `ac_num`.
@@ -275,10 +324,9 @@ class MonsterParser(NodeParser):
 
         yield ('ac', text)
 
-        #m = re.match('^(\d+)(?: \(.*)?$', text)
-        m = re.match('^(\d+)(?: \(([^)]*)\))?$', text)
+        m = cls.re_num_note.match(text)
         if m is None:
-            debug(f'Failed match for AC text "{text}"')
+            debug('Failed match for AC text "%s"', text)
             return
         g = m.groups()
         if g[0]:
@@ -286,8 +334,8 @@ class MonsterParser(NodeParser):
         if g[1]:
             yield ('armor', g[1])
 
-    @staticmethod
-    def yield_hp(element, node):
+    @classmethod
+    def yield_hp(cls, element, node):
         """Assign to hp attributes.
 
         Similar to yield_ac but parses `hp` and `hitdice` attributes.
@@ -309,17 +357,37 @@ class MonsterParser(NodeParser):
         """
         text = element.text
 
-        m = re.match('^(\d+)(?: \(([^)]*)\))?$', text)
+        m = cls.re_num_note.match(text)
         if m is None:
-            debug(f'Failed match for HP text "{text}"')
+            debug('Failed match for HP text "%s"', text)
             return
         g = m.groups()
         yield ('hp', int(g[0]))
         if g[1]:
             yield ('hitdice', g[1])
 
-    @staticmethod
-    def yield_speed(element, node):
+    # Speed-field regexes.  These are assembled and compiled once here
+    # rather than on every yield_speed call.
+    _movement_types = ['walk', 'fly', 'swim', 'climb', 'burrow']
+    _mt_re = '(?:' + '|'.join(_movement_types) + ')'
+    _vector_re_basic = f'(?:{_mt_re} )?\d+ ?ft\.?' # [movement_type] speed
+    _vector_re_hover = f'fly \d+ ft. \([Hh]over\)'
+    _vector_re_speed_first = f'\d+ ?ft\.? {_mt_re}'
+    _vector_just_a_number = f'\d+'
+    _vector_vehicle_speed = r'^\d+ miles per hour \(\d+ miles per day\)$'
+    _vector_re = (f'(?:{_vector_re_basic}|{_vector_re_hover}|'
+                  + f'{_vector_re_speed_first}|{_vector_just_a_number}|'
+                  + f'{_vector_vehicle_speed})')
+    re_speed_csv = re.compile(f'^({_vector_re})(?:, ({_vector_re}))*$') # list of speeds, no ()
+    re_speed_csv_iter = re.compile(f'^({_vector_re})(?:, ({_vector_re}(?:, {_vector_re})*))?$')
+    # capture groups for type and speed
+    re_parse_vector = re.compile(f'^(?:({_mt_re}) )?(\d+) ?ft\.?(?: \([Hh]over\))?$')
+    re_parse_vector_speed_first = re.compile(f'^(\d+) ?ft\.? ({_mt_re})$')
+    re_parse_vector_just_a_number = re.compile('^(\d+)$')
+    re_parse_vector_vehicle_speed = re.compile('^(\d+) miles per hour \(\d+ miles per day\)$')
+
+    @classmethod
+    def yield_speed(cls, element, node):
         """Parse speed fields into a dictionary.
 
         >>> from legendlore.test import obj_fromdict
@@ -380,19 +448,6 @@ class MonsterParser(NodeParser):
         """
         text = element.text
 
-        movement_types = ['walk', 'fly', 'swim', 'climb', 'burrow']
-        mt_re = '(?:' + '|'.join(movement_types) + ')'
-        vector_re_basic = f'(?:{mt_re} )?\d+ ?ft\.?' # [movement_type] speed
-        vector_re_hover = f'fly \d+ ft. \([Hh]over\)'
-        vector_re_speed_first = f'\d+ ?ft\.? {mt_re}'
-        vector_just_a_number = f'\d+'
-        vector_vehicle_speed = r'^\d+ miles per hour \(\d+ miles per day\)$'
-        vector_re = (f'(?:{vector_re_basic}|{vector_re_hover}|'
-                      + f'{vector_re_speed_first}|{vector_just_a_number}|'
-                      + f'{vector_vehicle_speed})')
-
-        csv_match_re = f'^({vector_re})(?:, ({vector_re}))*$' # list of speeds, no ()
-
         def parse_vector(vector):
             """Parse a movement vector and return (type, speed).
 
@@ -409,13 +464,7 @@ class MonsterParser(NodeParser):
             >>> parse_vector("12 miles per hour (288 miles per day)")
             ('mph', 12)
             """
-            # capture groups for type and speed
-            parse_re = f'^(?:({mt_re}) )?(\d+) ?ft\.?(?: \([Hh]over\))?$'
-            parse_re_speed_first = f'^(\d+) ?ft\.? ({mt_re})$'
-            parse_re_just_a_number = '^(\d+)$'
-            parse_re_vehicle_speed = '^(\d+) miles per hour \(\d+ miles per day\)$'
-
-            m = re.match(parse_re, vector)
+            m = cls.re_parse_vector.match(vector)
             if m:
                 g = m.groups()
                 if g[0] is None:  # the movement type was implied
@@ -424,25 +473,24 @@ class MonsterParser(NodeParser):
                     mtype = g[0]
                 return (mtype, int(g[1]))
 
-            m = re.match(parse_re_speed_first, vector)
+            m = cls.re_parse_vector_speed_first.match(vector)
             if m:
                 return (m.group(2), int(m.group(1)))
 
-            m = re.match(parse_re_just_a_number, vector)
+            m = cls.re_parse_vector_just_a_number.match(vector)
             if m:
                 return ('walk', int(m.group(1)))
 
-            m = re.match(parse_re_vehicle_speed, vector)
+            m = cls.re_parse_vector_vehicle_speed.match(vector)
             if m:
                 return ('mph', int(m.group(1)))
 
             raise Exception(f'parse_vector: invalid match on "{vector}"')
 
-        if re.match(csv_match_re, text):
-            csv_iter_re = f'^({vector_re})(?:, ({vector_re}(?:, {vector_re})*))?$'
+        if cls.re_speed_csv.match(text):
             def iter_vectors(text):
                 while text:
-                    m = re.match(csv_iter_re, text)
+                    m = cls.re_speed_csv_iter.match(text)
                     if m:
                         yield m.group(1)
                         text = m.group(2)
@@ -486,7 +534,7 @@ class MonsterParser(NodeParser):
             try:
                 yield ('speed', irregulars[text])
             except KeyError:
-                warning(f'yield_speed failed to match "{text}"')
+                warning('yield_speed failed to match "%s"', text)
 
     (yield_str, yield_dex, yield_con,
      yield_int, yield_wis, yield_cha) = map(staticmethod, [yield_int] * 6)
@@ -517,7 +565,7 @@ class MonsterParser(NodeParser):
             saves = (re.split(' +', save) for save in saves)
             saves = ((stat.lower(), int(val)) for stat, val in saves)
         except:
-            error(f'yield_saves: parsing error for text "{text}"')
+            error('yield_saves: parsing error for text "%s"', text)
             return
 
         yield ('saves', dict(saves))
@@ -562,7 +610,7 @@ class MonsterParser(NodeParser):
             skills = (re.split(' \+', skill) for skill in skills)
             skills = dict((normalize(skill), int(val)) for skill, val in skills)
         except Exception as e:
-            error(f'yield_skill: {type(e)} "{e}" for text "{text}"')
+            error('yield_skill: %s "%s" for text "%s"', type(e), e, text)
 
         yield ('skills', skills)
 
@@ -649,7 +697,7 @@ class MonsterParser(NodeParser):
                     found += csvs
 
         for item in notfound:
-            warning(f'Unrecognised scsv "{item}" in text "{text}"')
+            warning('Unrecognised scsv "%s" in text "%s"', item, text)
 
         # Now check the parsed field contents for any items
         # which require remapping to multiple or different items
@@ -747,7 +795,7 @@ class MonsterParser(NodeParser):
         try:
             yield (field, set(process_csv(csv) for csv in csvs))
         except Exception as e:
-            warning(f'yield_condition: {e.args[0]}')
+            warning('yield_condition: %s', e.args[0])
 
     @staticmethod
     def yield_senses(element, node):
@@ -829,7 +877,7 @@ class MonsterParser(NodeParser):
         try:
             senses = reduce(dict_merge, mapped_components)
         except TypeError:
-            warning(f'yield_senses: failed match on text "{text}"')
+            warning('yield_senses: failed match on text "%s"', text)
             return
 
         yield (field, senses)
@@ -842,43 +890,43 @@ class MonsterParser(NodeParser):
 
     @staticmethod
     def yield_action(element, node):
-        debug(f'MonsterParser.yield_action called for element "{element}"')
+        debug('MonsterParser.yield_action called for element "%s"', element)
         yield ('action', dict(MonsterActionParser.parse(element)))
 
     ## TODO: write these stubs
     @staticmethod
     def yield_save(element, node):
-        debug(f'MonsterParser.yield_save called for element "{element}"')
+        debug('MonsterParser.yield_save called for element "%s"', element)
         if False:
             yield
 
     @staticmethod
     def yield_languages(element, node):
-        debug(f'MonsterParser.yield_languages called for element "{element}"')
+        debug('MonsterParser.yield_languages called for element "%s"', element)
         if False:
             yield
 
     @staticmethod
     def yield_trait(element, node):
-        debug(f'MonsterParser.yield_trait called for element "{element}"')
+        debug('MonsterParser.yield_trait called for element "%s"', element)
         if False:
             yield
 
     @staticmethod
     def yield_environment(element, node):
-        debug(f'MonsterParser.yield_environment called for element "{element}"')
+        debug('MonsterParser.yield_environment called for element "%s"', element)
         if False:
             yield
 
     @staticmethod
     def yield_legendary(element, node):
-        debug(f'MonsterParser.yield_legendary called for element "{element}"')
+        debug('MonsterParser.yield_legendary called for element "%s"', element)
         if False:
             yield
 
     @staticmethod
     def yield_reaction(element, node):
-        debug(f'MonsterParser.yield_reaction called for element "{element}"')
+        debug('MonsterParser.yield_reaction called for element "%s"', element)
         if False:
             yield
 
@@ -911,20 +959,20 @@ class MonsterParser(NodeParser):
 
 class MonsterActionParser(NodeParser):
     _join = ('text',)
-    re_damage = r'-?[0-9]+(?:d[0-9]+(?:[+-][0-9]+)?)?'
-    re_attack_bonus = r'[+-][0-9]+'
+    re_damage = re.compile(r'-?[0-9]+(?:d[0-9]+(?:[+-][0-9]+)?)?')
+    re_attack_bonus = re.compile(r'[+-][0-9]+')
     @classmethod
     def yield_attack(cls, element, node):
         # First of the fields is the name; this is redundant with the action 'name' element text.
         _, attack_bonus, damage = element.text.split('|')
         if attack_bonus:
-            if not re.fullmatch(cls.re_attack_bonus, attack_bonus):
-                warning(f'MonsterActionParser.yield_attack: validation fail for attack bonus "{attack_bonus}"')
+            if not cls.re_attack_bonus.fullmatch(attack_bonus):
+                warning('MonsterActionParser.yield_attack: validation fail for attack bonus "%s"', attack_bonus)
             attack_bonus = int(attack_bonus)
             yield ('attack_bonus', attack_bonus)
         if damage:
-            if not re.fullmatch(cls.re_damage, damage):
-                warning(f'MonsterActionParser.yield_attack: validation fail for damage string "{damage}"')
+            if not cls.re_damage.fullmatch(damage):
+                warning('MonsterActionParser.yield_attack: validation fail for damage string "%s"', damage)
             yield ('damage', damage)
     yield_text = yield_text
 
@@ -943,8 +991,8 @@ class SpellParser(NodeParser):
     yield_time = partial(yield_datatype, datatypes.CastingTime)
     yield_range = partial(yield_datatype, datatypes.SpellRange)
 
-    re_components = r'\bM \(([^)]*)\)'
-    re_value = r'\b([0-9,]+)\s?([gs]p|gold pieces)\b'
+    re_components = re.compile(r'\bM \(([^)]*)\)')
+    re_value = re.compile(r'\b([0-9,]+)\s?([gs]p|gold pieces)\b')
 
     @classmethod
     def yield_components(cls, element, node):
@@ -981,16 +1029,22 @@ class SpellParser(NodeParser):
         if text == None:
             return None
 
-        components = re.sub(cls.re_components, 'M', text)
+        # Collapse material clauses to bare 'M' tokens, capturing their
+        # details as we go so the text is only scanned once.
+        material = []
+        def collapse(match):
+            material.append(match.groups()[0])
+            return 'M'
+
+        components = cls.re_components.sub(collapse, text)
         components = re.split(',\s*', components)
         components = dict.fromkeys(components, True)
 
-        material_details = re.search(cls.re_components, text)
-        if material_details:
+        if material:
+            material_details = material[0]
             if 'M' not in components:
-                warning(f'yield_components: material details "{material_details}"'
-                        + f' but no M in components "{text}"')
-            material_details = material_details.groups()[0]
+                warning('yield_components: material details "%s"'
+                        ' but no M in components "%s"', material_details, text)
             components.update({'M': material_details})
             components.update(cls.parse_material_value(material_details))
         yield ('components', components)
@@ -1011,7 +1065,7 @@ class SpellParser(NodeParser):
         # Any spells with both used and consumed components with monetary value
         # are handled by exceptions, so here we just look for a monetary value
         # and then check for the string "consume"
-        value = re.search(cls.re_value, details)
+        value = cls.re_value.search(details)
         if value:
             quantity, units = value.groups()
             # Monetary values sometimes contain commas, e.g. "1,000"
@@ -1045,9 +1099,9 @@ class SpellParser(NodeParser):
         if duration is None:
             return False, None
 
-        if duration[:15] == 'Concentration, ':
+        if duration.startswith('Concentration, '):
             conc, time = True, duration[15:]
-        elif duration[:15] == 'Instantaneous, ':
+        elif duration.startswith('Instantaneous, '):
             conc, time = False, duration[15:]
         else:
             conc, time = False, duration
@@ -1055,7 +1109,7 @@ class SpellParser(NodeParser):
         try:
             time = datatypes.SpellDuration(time)
         except KeyError as e:
-            warning(f'parse_spell_duration: unknown spell duration in "{duration}".  Parsed conc: {conc}, time: {time}')
+            warning('parse_spell_duration: unknown spell duration in "%s".  Parsed conc: %s, time: %s', duration, conc, time)
 
         yield ('concentration', conc)
         yield ('duration', time)
@@ -1068,16 +1122,25 @@ class SpellParser(NodeParser):
             yield ('classes', [])
             return
 
-        classes = re.split(',\s*', classes)
-        classes = [c.strip() for c in classes]
+        # The same few dozen class names recur across every spell, so
+        # intern them: duplicates collapse to one string object and later
+        # comparisons can short-circuit on identity.
+        if ',' not in classes:
+            # most class lists are a single name; skip the regex split
+            classes = [intern(classes.strip())]
+        else:
+            classes = re.split(',\s*', classes)
+            classes = [intern(c.strip()) for c in classes]
         for c in classes:
             if c not in datatypes.caster_classes:
-                warning(f'yield_classes: unknown caster class "{c}"')
+                warning('yield_classes: unknown caster class "%s"', c)
         yield ('classes', sorted(classes))
 
     # Parsing of spell text and sources is handled in _postprocess
     yield_text = yield_text
 
+    re_source = re.compile('^\s*(?P<book>.*?),?\s*p\.?\s*(?P<page>\d+)\s*(?P<extra>.*).*$')
+
     @classmethod
     def _postprocess(cls, results):
         """Post-processing for spell nodes.
@@ -1158,7 +1221,7 @@ class SpellParser(NodeParser):
                 continue
 
             line = line.strip()
-            if line[:8] == 'Source: ':
+            if line.startswith('Source: '):
                 in_sources = True
                 sources += cls._parse_spell_source(line[8:])
             elif in_sources:
@@ -1179,11 +1242,15 @@ class SpellParser(NodeParser):
         return chainfi([None] if l is None else l.split('\n') for l in lines)
 
     @classmethod
+    @lru_cache(maxsize=None)
     def _parse_spell_source(cls, source):
         """Breaks source line into Reference(book, page) components.
 
         Returns a list of Reference objects.
 
+        The same source line appears in many spells, so results are
+        memoized; callers only read or copy the returned list.
+
         >>> source = "Xanathar's Guide to Everything, p. 152"
         >>> SpellParser._parse_spell_source(source)
         [Reference(book="Xanathar's Guide to Everything", page=152)]
@@ -1202,11 +1269,11 @@ class SpellParser(NodeParser):
             # There are occasional blank lines, which we ignore
             return []
 
-        m = re.match('^\s*(?P<book>.*?),?\s*p\.?\s*(?P<page>\d+)\s*(?P<extra>.*).*$', source)
+        m = cls.re_source.match(source)
         if m:
             book = m.groupdict()['book']
             if book not in datatypes.sources:
-                warning(f"parse_spell_source: invalid source '{book}' parsed on line '{source}'")
+                warning("parse_spell_source: invalid source '%s' parsed on line '%s'", book, source)
             this_reference = [Reference(m.groupdict()['book'], int(m.groupdict()['page']))]
             extra = m.groupdict()['extra']
         elif source in datatypes.sources:  # some entries don't give page numbers
@@ -1214,7 +1281,7 @@ class SpellParser(NodeParser):
             # Currently, pageless references only occur at the end of lines, so we can do this for now.
             extra = None
         else:
-            warning(f"parse_spell_source: failed match on line '{source}'")
+            warning("parse_spell_source: failed match on line '%s'", source)
             return []
 
         if not extra:
@@ -1222,6 +1289,6 @@ class SpellParser(NodeParser):
         if extra[0] == ',':
             return this_reference + cls._parse_spell_source(extra[1:].strip())
         else:
-            warning(f"parse_spell_source: source '{source}': unknown extra '{extra}'")
+            warning("parse_spell_source: source '%s': unknown extra '%s'", source, extra)
 
     yield_roll = yield_text
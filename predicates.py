@@ -32,30 +32,45 @@ def _hasvalue(obj, attr):
     """True if the attribute `attr` of `obj` exists and is not None."""
     return getattr(obj, attr, None) != None
 
+def _ranked(rank, pred):
+    """Tags `pred` with a selectivity rank.
+
+    Collection.where runs cheaper, more selective predicates first:
+    0 for equality checks, 1 for ordering comparisons, 2 for
+    containment/key tests; untagged predicates (combinators, arbitrary
+    callables) default to last.
+    """
+    pred._rank = rank
+    return pred
+
+# The lambdas below fetch the attribute once and reuse it via the walrus
+# operator; predicates run per item over whole collections, so the saved
+# second getattr adds up.  The `!= None` check deliberately mirrors
+# _hasvalue, which lets datatypes with custom __eq__ decide whether they
+# count as empty.
 def eq(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) == val
+    return _ranked(0, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v == val)
 def ne(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) != val
+    return _ranked(0, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v != val)
 def lt(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) < val
+    return _ranked(1, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v < val)
 def lte(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) <= val
+    return _ranked(1, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v <= val)
 def gt(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) > val
+    return _ranked(1, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v > val)
 def gte(val):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) >= val
+    return _ranked(1, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v >= val)
 def between(lowbound, highbound):
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) >= lowbound and getattr(obj, attr) <= highbound
+    return _ranked(1, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v >= lowbound and v <= highbound)
 def key(val):
     """Check if the attr is a dict and contains a key with name == val."""
     def keypred(field_name, obj):
-        if hasattr(obj, field_name):
-            attr = getattr(obj, field_name)
-            if hasattr(attr, 'keys'):
-                if val in attr.keys():
-                    return True
+        attr = getattr(obj, field_name, None)
+        if hasattr(attr, 'keys'):
+            if val in attr.keys():
+                return True
         return False
-    return keypred
+    return _ranked(2, keypred)
 def contains(val):
     """Check if `attr` contains `val`.
     >>> from legendlore.test import s
@@ -64,7 +79,7 @@ def contains(val):
     Fortune's Favor 1m/T/1h [V/S/M@!100!gp] (2:WzC+WzG)
     Circle of Death A/150'/I [V/S/M@500gp] (6:S+Wl+Wz)
     """
-    return lambda attr, obj: _hasvalue(obj, attr) and val in getattr(obj, attr)
+    return _ranked(2, lambda attr, obj: (v := getattr(obj, attr, None)) != None and val in v)
 
 def in_(val):
     """Check if `val` is in the value of `attr`.
@@ -77,7 +92,7 @@ def in_(val):
     Vampiric Touch A/S/C<=1m [V/S] (3:CD+CG+Wl+Wz)
     Storm Sphere A/150'/C<=1m [V/S] (4:S+Wz)
     """
-    return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr) in val
+    return _ranked(2, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v in val)
 
 def apply(fn, val):
     """Returned predicate passes (attr, val) to fn, returns result.
@@ -88,11 +103,12 @@ def apply(fn, val):
     >>> len(m.where(type=apply(str.startswith, 'humanoid')))
     778
     """
-    return lambda attr, obj: _hasvalue(obj, attr) and fn(getattr(obj, attr), val)
+    return lambda attr, obj: (v := getattr(obj, attr, None)) != None and fn(v, val)
 
 def startswith(val, ignorecase=True):
     if ignorecase:
-        return lambda attr, obj: _hasvalue(obj, attr) and getattr(obj, attr).lower().startswith(val.lower())
+        lval = val.lower()
+        return _ranked(2, lambda attr, obj: (v := getattr(obj, attr, None)) != None and v.lower().startswith(lval))
     else:
         return apply(str.startswith, val)
 
@@ -241,4 +257,4 @@ def dictvalue(key, pred):
             return pred(key, obj_fromdict(dictionary))
         return False
 
-    return dictvalue_closure
+    return _ranked(2, dictvalue_closure)